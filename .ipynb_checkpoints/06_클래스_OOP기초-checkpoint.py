@@ -349,13 +349,14 @@ class GeminiClient:
     Gemini API 클라이언트
     
     클래스 문법 활용:
-    - 클래스 속성: BASE_URL (모든 인스턴스 공유)
-    - 인스턴스 속성: api_key, model, timeout
+    - 클래스 속성: BASE_URL, POOL_SIZE (모든 인스턴스 공유)
+    - 인스턴스 속성: api_key, model, timeout, session
     - 인스턴스 메서드: generate(), extract_text() 등
     """
     
     # 클래스 속성 (모든 인스턴스가 공유)
     BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+    POOL_SIZE = 10  # 재사용할 HTTP 연결 수
     
     def __init__(self, api_key: Optional[str] = None, model: str = "gemini-1.5-flash"):
         """
@@ -369,30 +370,26 @@ class GeminiClient:
         self.model = model
         self.timeout = 30
         self._request_count = 0  # 요청 횟수 추적
+        self.session = self._create_session()
     
-    def generate(
-        self, 
-        prompt: str, 
+    def _create_session(self) -> requests.Session:
+        """keep-alive 연결을 재사용하는 Session 생성 (private 메서드)"""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE
+        )
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json"})
+        return session
+    
+    def _build_payload(
+        self,
+        prompt: str,
         system_prompt: Optional[str] = None,
         max_tokens: int = 1024
     ) -> dict:
-        """
-        텍스트 생성 API 호출
-        
-        Args:
-            prompt: 사용자 프롬프트
-            system_prompt: 시스템 프롬프트 (선택)
-            max_tokens: 최대 출력 토큰
-        
-        Returns:
-            API 응답 딕셔너리
-        """
-        if not self.api_key:
-            return self._simulate_response(prompt)
-        
-        url = f"{self.BASE_URL}/models/{self.model}:generateContent"
-        
-        # 요청 본문 구성
+        """API 요청 본문 구성 (private 메서드)"""
         contents = []
         
         if system_prompt:
@@ -406,19 +403,66 @@ class GeminiClient:
             "parts": [{"text": prompt}]
         })
         
-        payload = {
+        return {
             "contents": contents,
             "generationConfig": {
                 "maxOutputTokens": max_tokens,
                 "temperature": 0.7
             }
         }
+    
+    @property
+    def url(self) -> str:
+        """generateContent 엔드포인트 (프로퍼티)"""
+        return f"{self.BASE_URL}/models/{self.model}:generateContent"
+    
+    @property
+    def stream_url(self) -> str:
+        """streamGenerateContent 엔드포인트 (프로퍼티)"""
+        return f"{self.BASE_URL}/models/{self.model}:streamGenerateContent"
+    
+    @staticmethod
+    def _parse_sse_line(line: str) -> str:
+        """SSE 한 줄(data: {...})에서 텍스트 조각 추출 (정적 메서드)"""
+        if not line.startswith("data:"):
+            return ""
+        chunk = json.loads(line[len("data:"):])
+        candidates = chunk.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+    
+    def _simulate_stream(self, prompt: str, chunk_size: int = 20) -> list[str]:
+        """시뮬레이션 응답을 조각으로 나누기 (private 메서드)"""
+        text = self.extract_text(self._simulate_response(prompt))
+        return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    
+    def generate(
+        self, 
+        prompt: str, 
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1024
+    ) -> dict:
+        """
+        텍스트 생성 API 호출
+        
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트 (선택)
+            max_tokens: 최대 출력 토큰
+        
+        Returns:
+            API 응답 딕셔너리
+        """
+        if not self.api_key:
+            return self._simulate_response(prompt)
+        
+        payload = self._build_payload(prompt, system_prompt, max_tokens)
         
         try:
-            response = requests.post(
-                url,
+            # Session을 재사용하므로 매 요청마다 TCP/TLS 연결을 새로 맺지 않음
+            response = self.session.post(
+                self.url,
                 params={"key": self.api_key},
-                headers={"Content-Type": "application/json"},
                 json=payload,
                 timeout=self.timeout
             )
@@ -427,7 +471,7 @@ class GeminiClient:
             return response.json()
             
         except requests.exceptions.RequestException as e:
-            return {"error": str(e)}
+            return self._error_response(e, e.response)
     
     def _simulate_response(self, prompt: str) -> dict:
         """API 키 없을 때 시뮬레이션 응답 (private 메서드)"""
@@ -453,6 +497,45 @@ class GeminiClient:
             "_simulated": True
         }
     
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1024
+    ):
+        """
+        텍스트를 생성되는 대로 조각 단위로 반환 (제너레이터)
+        
+        전체 응답을 기다리지 않고 첫 조각부터 바로 사용할 수 있습니다.
+        HTTP 오류는 예외로 전달됩니다.
+        """
+        if not self.api_key:
+            yield from self._simulate_stream(prompt)
+            return
+        
+        payload = self._build_payload(prompt, system_prompt, max_tokens)
+        with self.session.post(
+            self.stream_url,
+            params={"key": self.api_key, "alt": "sse"},
+            json=payload,
+            timeout=self.timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            self._request_count += 1
+            for line in response.iter_lines(chunk_size=None):  # 도착하는 즉시 처리
+                text = self._parse_sse_line(line.decode("utf-8"))
+                if text:
+                    yield text
+    
+    def _error_response(self, error: Exception, response=None) -> dict:
+        """에러 응답 구성: HTTP 상태 코드와 Retry-After 헤더도 기록 (private 메서드)"""
+        result = {"error": str(error)}
+        if response is not None:
+            result["status"] = response.status_code
+            result["retry_after"] = response.headers.get("Retry-After")
+        return result
+    
     def extract_text(self, response: dict) -> str:
         """응답에서 텍스트 추출"""
         try:
@@ -465,6 +548,18 @@ class GeminiClient:
         response = self.generate(prompt, **kwargs)
         return self.extract_text(response)
     
+    def close(self):
+        """연결 풀 정리"""
+        self.session.close()
+    
+    def __enter__(self):
+        """with 문 진입"""
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        """with 문 종료 시 연결 정리"""
+        self.close()
+    
     def to_dict(self) -> dict:
         """객체를 딕셔너리로 변환 (to_dict 패턴)"""
         return {
@@ -513,18 +608,308 @@ response = gemini.generate_text(
 )
 print(response)
 
+# %%
+# 스트리밍: 생성되는 대로 출력 (제너레이터)
+for chunk in gemini.generate_stream("파이썬의 역사를 간단히 설명해주세요."):
+    print(chunk, end="", flush=True)
+print()
+
 # %%
 # 요청 횟수 확인
 print(f"총 요청 횟수: {gemini._request_count}")
 
+# %% [markdown]
+# ---
+# ## 6.8.1 비동기 클라이언트: AsyncGeminiClient
+#
+# `GeminiClient.generate()`는 응답이 올 때까지 스레드를 막습니다.
+# asyncio 기반 서비스에서는 `httpx.AsyncClient`로 하나의 연결 풀을 공유하며
+# 수천 개의 요청을 동시에 보낼 수 있습니다. (선택 패키지: `pip install httpx`)
+# - 메서드 이름은 같고 `await`로 호출합니다: `generate`, `generate_text`
+# - `extract_text`, `_build_payload`, `_simulate_response`는 부모 클래스의 것을 그대로 사용
+# - 연결 정리는 `with`가 아니라 `async with`로 합니다 (`close()`가 비동기 메서드)
+
+# %%
+import asyncio
+
+try:
+    import httpx  # 선택 패키지: AsyncGeminiClient에서만 사용
+except ImportError:
+    httpx = None
+
+class AsyncGeminiClient(GeminiClient):
+    """
+    asyncio용 Gemini 클라이언트
+    
+    GeminiClient를 상속하되 HTTP 요청만 비동기로 바꿉니다.
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-1.5-flash",
+        max_connections: int = 100
+    ):
+        self.max_connections = max_connections
+        super().__init__(api_key, model)
+    
+    def _create_session(self) -> "httpx.AsyncClient":
+        """keep-alive 연결 풀을 가진 AsyncClient 생성 (메서드 오버라이드)"""
+        if httpx is None:
+            raise ImportError("AsyncGeminiClient에는 httpx가 필요합니다: pip install httpx")
+        return httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            # pool=None: 연결이 모두 사용 중이면 빈 연결이 생길 때까지 대기
+            timeout=httpx.Timeout(self.timeout, pool=None),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            )
+        )
+    
+    async def generate(
+        self, 
+        prompt: str, 
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1024
+    ) -> dict:
+        """텍스트 생성 API 호출 (비동기)"""
+        if not self.api_key:
+            return self._simulate_response(prompt)
+        
+        payload = self._build_payload(prompt, system_prompt, max_tokens)
+        
+        try:
+            response = await self.session.post(
+                self.url,
+                params={"key": self.api_key},
+                json=payload
+            )
+            response.raise_for_status()
+            self._request_count += 1
+            return response.json()
+            
+        except httpx.HTTPError as e:
+            return self._error_response(e, getattr(e, "response", None))
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1024
+    ):
+        """텍스트를 생성되는 대로 조각 단위로 반환 (비동기 제너레이터)"""
+        if not self.api_key:
+            for text in self._simulate_stream(prompt):
+                yield text
+            return
+        
+        payload = self._build_payload(prompt, system_prompt, max_tokens)
+        async with self.session.stream(
+            "POST",
+            self.stream_url,
+            params={"key": self.api_key, "alt": "sse"},
+            json=payload
+        ) as response:
+            response.raise_for_status()
+            self._request_count += 1
+            async for line in response.aiter_lines():
+                text = self._parse_sse_line(line)
+                if text:
+                    yield text
+    
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        """텍스트만 반환하는 간편 메서드 (비동기)"""
+        response = await self.generate(prompt, **kwargs)
+        return self.extract_text(response)
+    
+    async def close(self):
+        """연결 풀 정리 (비동기)"""
+        await self.session.aclose()
+    
+    def __enter__(self):
+        """동기 with 문은 연결을 정리할 수 없으므로 막음"""
+        raise TypeError("AsyncGeminiClient는 'async with'로 사용하세요")
+    
+    def __exit__(self, exc_type, exc, tb):
+        """__enter__가 막혀 있으므로 호출되지 않음"""
+        raise TypeError("AsyncGeminiClient는 'async with'로 사용하세요")
+    
+    async def __aenter__(self):
+        """async with 문 진입"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """async with 문 종료 시 연결 정리"""
+        await self.close()
+    
+    def __repr__(self) -> str:
+        """부모 메서드 오버라이드"""
+        return f"AsyncGeminiClient(model='{self.model}', max_connections={self.max_connections})"
+
+# %%
+from concurrent.futures import ThreadPoolExecutor
+
+def run_async(coro):
+    """
+    코루틴을 실행하고 결과를 반환
+    
+    Jupyter처럼 이벤트 루프가 이미 실행 중이면 asyncio.run()이 RuntimeError를 내므로,
+    그때는 별도 스레드의 새 이벤트 루프에서 실행합니다.
+    (Jupyter 셀에서는 `answers = await generate_many(questions)`처럼 바로 await해도 됩니다)
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)  # 일반 스크립트
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+# %%
+# 여러 프롬프트를 동시에 요청
+async def generate_many(prompts: list[str]) -> list[str]:
+    async with AsyncGeminiClient() as client:
+        return await asyncio.gather(*(client.generate_text(p) for p in prompts))
+
+async def ask_questions(questions: list[str]) -> None:
+    answers = await generate_many(questions)
+    for q, a in zip(questions, answers):
+        print(f"{q} → {a[:40]}...")
+
+if httpx is not None:
+    run_async(ask_questions(["파이썬이란?", "클래스란?", "상속이란?"]))
+else:
+    print("httpx가 설치되지 않아 AsyncGeminiClient 예제를 건너뜁니다 (pip install httpx)")
+
 # %% [markdown]
 # ---
 # ## 6.9 상속으로 기능 확장: RobustGeminiClient
 
+# %% [markdown]
+# ### 요청 속도 제한: RateLimiter
+#
+# 여러 클라이언트가 각자 재시도하면 할당량(quota) 초과 시 모두 동시에 몰려들었다가 동시에 멈춥니다.
+# 프로세스 전체가 하나의 **토큰 버킷**을 공유하면 요청 속도를 할당량 근처로 유지할 수 있습니다.
+# - 분당 요청 수(requests/min)와 분당 토큰 수(tokens/min) 두 개의 버킷
+# - 429/5xx 응답 시 속도를 절반으로 줄이고(multiplicative decrease), 성공할 때마다 조금씩 늘림(additive increase)
+# - `Retry-After` 헤더가 있으면 그 시간 동안 모든 요청을 멈춤
+# - 토큰은 요청 전에 최대치(입력 + `max_tokens`)로 예약하고, 응답의 `usageMetadata`로 실제 사용량을 확인해 남은 만큼 돌려줌
+
 # %%
 import time
 import random
+import threading
+from email.utils import parsedate_to_datetime
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    토큰 버킷 기반 요청 속도 제한기 (AIMD 방식으로 속도 자동 조절)
+    
+    스레드 안전하므로 여러 클라이언트 인스턴스가 하나를 공유할 수 있습니다.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        tokens_per_minute: Optional[float] = None,
+        min_ratio: float = 0.1,
+        increase_ratio: float = 0.05
+    ):
+        """
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (할당량)
+            tokens_per_minute: 분당 최대 토큰 수 (None이면 제한 없음)
+            min_ratio: 속도를 줄일 때의 하한 (할당량 대비 비율)
+            increase_ratio: 성공 시 늘리는 속도 (할당량 대비 비율)
+        """
+        self.max_rpm = requests_per_minute
+        self.rpm = requests_per_minute  # 현재 허용 속도 (AIMD로 조절)
+        self.tpm = tokens_per_minute
+        self.min_rpm = requests_per_minute * min_ratio
+        self.increase = requests_per_minute * increase_ratio
+        
+        self._lock = threading.Lock()
+        self._requests = 1.0  # 요청 버킷에 남은 토큰
+        self._tokens = tokens_per_minute or 0.0  # 토큰 버킷에 남은 토큰
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0  # Retry-After로 정지된 시각
+    
+    def _refill(self, now: float):
+        """경과 시간만큼 버킷 채우기 (lock 안에서 호출)"""
+        elapsed = now - self._updated
+        self._updated = now
+        # 요청 버킷 용량은 1초 분량 (최소 1개) - 순간 폭주 방지
+        capacity = max(1.0, self.rpm / 60)
+        self._requests = min(capacity, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+    
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        요청 1개와 토큰 tokens개를 사용할 수 있을 때까지 대기
+        
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.tpm:
+            tokens = min(tokens, self.tpm)  # 버킷보다 큰 요청이 영원히 기다리지 않도록
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    wait = (1 - self._requests) * 60 / self.rpm
+                if wait <= 0 and self.tpm and tokens > self._tokens:
+                    wait = (tokens - self._tokens) * 60 / self.tpm
+                if wait <= 0:
+                    self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= tokens
+                    return waited
+            time.sleep(wait)
+            waited += wait
+    
+    def refund(self, tokens: int):
+        """예약했지만 사용하지 않은 토큰을 버킷에 돌려줌"""
+        if self.tpm and tokens > 0:
+            with self._lock:
+                self._tokens = min(self.tpm, self._tokens + tokens)
+    
+    def on_success(self):
+        """성공: 속도를 조금씩 늘림 (additive increase)"""
+        with self._lock:
+            self.rpm = min(self.max_rpm, self.rpm + self.increase)
+    
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """429/5xx: 속도를 절반으로 줄이고 Retry-After 동안 정지 (multiplicative decrease)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rpm = max(self.min_rpm, self.rpm / 2)
+            self._requests = min(self._requests, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+    
+    def __repr__(self) -> str:
+        return f"RateLimiter(rpm={self.rpm:.1f}/{self.max_rpm}, tpm={self.tpm})"
 
+# %%
 class RobustGeminiClient(GeminiClient):
     """
     재시도 로직이 포함된 Gemini 클라이언트
@@ -533,32 +918,68 @@ class RobustGeminiClient(GeminiClient):
     - GeminiClient의 모든 기능 상속
     - super().__init__()으로 부모 생성자 호출
     - 새로운 메서드 추가
+    
+    클래스 속성 rate_limiter는 모든 인스턴스가 공유합니다.
     """
     
-    def __init__(self, api_key: Optional[str] = None, max_retries: int = 3):
+    # 프로세스 전체가 공유하는 속도 제한기 (할당량에 맞게 조정)
+    rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_retries: int = 3,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         super().__init__(api_key)  # 부모 생성자 호출
         self.max_retries = max_retries  # 추가 속성
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter  # 인스턴스 전용 제한기로 교체
+    
+    @staticmethod
+    def _is_throttled(status: Optional[int]) -> bool:
+        """할당량 초과(429) 또는 서버 오류(5xx) 여부"""
+        return status is not None and (status == 429 or status >= 500)
+    
+    def _estimate_tokens(self, prompt: str, **kwargs) -> int:
+        """요청이 사용할 토큰 수 추정 (입력: 약 2자당 1토큰 + 최대 출력 토큰)"""
+        system_prompt = kwargs.get("system_prompt") or ""
+        return (len(prompt) + len(system_prompt)) // 2 + kwargs.get("max_tokens", 1024)
+    
+    @staticmethod
+    def _used_tokens(response: dict) -> Optional[int]:
+        """응답의 usageMetadata에 기록된 실제 사용 토큰 수 (없으면 None)"""
+        return response.get("usageMetadata", {}).get("totalTokenCount")
     
     def generate_with_retry(self, prompt: str, **kwargs) -> dict:
         """재시도 로직이 포함된 생성"""
         last_error = None
+        tokens = self._estimate_tokens(prompt, **kwargs)
         
         for attempt in range(self.max_retries):
-            try:
-                response = self.generate(prompt, **kwargs)
-                
-                # 에러 응답 체크
-                if "error" in response:
-                    raise Exception(response["error"])
-                
+            self.rate_limiter.acquire(tokens)
+            response = self.generate(prompt, **kwargs)
+            
+            if "error" not in response:
+                self.rate_limiter.on_success()
+                used = self._used_tokens(response)
+                if used is not None:
+                    self.rate_limiter.refund(tokens - used)  # 예약했지만 쓰지 않은 토큰
                 return response
-                
-            except Exception as e:
-                last_error = e
-                
-                # 지수 백오프
+            
+            last_error = response["error"]
+            status = response.get("status")
+            print(f"시도 {attempt + 1}/{self.max_retries} 실패: {last_error}")
+            
+            if self._is_throttled(status):
+                # 대기는 공유 제한기가 담당: 모든 클라이언트가 함께 속도를 낮춤
+                self.rate_limiter.refund(tokens)  # 처리되지 않은 요청의 토큰은 돌려받음
+                self.rate_limiter.on_throttle(parse_retry_after(response.get("retry_after")))
+            elif status is not None:
+                return response  # 400, 403 등은 재시도해도 같은 결과
+            else:
+                # 네트워크 오류: 지수 백오프
                 delay = (2 ** attempt) + random.uniform(0, 1)
-                print(f"시도 {attempt + 1}/{self.max_retries} 실패: {e}")
                 print(f"{delay:.1f}초 후 재시도...")
                 time.sleep(delay)
         
@@ -581,7 +1002,7 @@ class RobustGeminiClient(GeminiClient):
     
     def __repr__(self) -> str:
         """부모 메서드 오버라이드"""
-        return f"RobustGeminiClient(model='{self.model}', max_retries={self.max_retries})"
+        return f"RobustGeminiClient(model='{self.model}', max_retries={self.max_retries}, {self.rate_limiter})"
 
 # %%
 # 상속 클래스 사용
@@ -597,46 +1018,379 @@ if success:
 else:
     print("실패:", text)
 
+# %% [markdown]
+# #### 로컬 가짜 서버로 할당량 초과(429) 처리 확인
+#
+# 처음 두 요청에는 `429 Too Many Requests`와 `Retry-After: 1`을, 그 뒤에는 정상 응답을 돌려주는 가짜 서버를 띄웁니다.
+# `BASE_URL`을 가짜 서버 주소로 바꾸면 실제 API 키 없이도 재시도와 속도 조절을 확인할 수 있습니다.
+
+# %%
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """처음 throttle_count개의 요청은 429, 그 뒤에는 정상 응답 (usageMetadata 포함)"""
+    throttle_count = 2
+    requests_seen = 0
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).requests_seen += 1
+        if self.requests_seen <= self.throttle_count:
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            body = b'{"error": {"code": 429, "message": "Resource exhausted"}}'
+        else:
+            self.send_response(200)
+            body = json.dumps({
+                "candidates": [{"content": {"parts": [{"text": "가짜 서버 응답"}], "role": "model"}}],
+                "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 20, "totalTokenCount": 30}
+            }).encode()
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # 요청 로그 생략
+
+
+fake_server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+threading.Thread(target=fake_server.serve_forever, daemon=True).start()
+
+limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=10_000)
+fake_client = RobustGeminiClient(api_key="fake-key", rate_limiter=limiter)
+fake_client.BASE_URL = f"http://127.0.0.1:{fake_server.server_port}/v1beta"  # 인스턴스 속성이 클래스 속성을 가림
+
+try:
+    start = time.perf_counter()
+    text, success = fake_client.safe_generate_text("속도 제한 테스트")
+    elapsed = time.perf_counter() - start
+finally:
+    fake_server.shutdown()
+    fake_server.server_close()
+
+print(f"결과: {text} (성공: {success}), 요청 {ThrottlingHandler.requests_seen}회, {elapsed:.1f}초")
+print(limiter)
+assert success and ThrottlingHandler.requests_seen == 3
+assert elapsed >= 2                                        # Retry-After 1초 × 2번 대기
+assert limiter.rpm == limiter.max_rpm / 4 + limiter.increase  # 절반 × 2번, 성공 후 조금 증가
+assert limiter._tokens > limiter.tpm - 100                 # 예약한 토큰 중 실제 사용량(30)만 소비
+
 # %% [markdown]
 # ---
 # ## 6.10 캐싱 기능 추가: CachedGeminiClient
 
+# %% [markdown]
+# ### 응답 캐시: ResponseCache
+#
+# `hash()`는 실행할 때마다 값이 달라지므로(salted) 파일에 저장해 다시 쓸 수 없습니다.
+# 대신 요청 내용(모델, 프롬프트, 시스템 프롬프트, 생성 설정)의 SHA-256 해시를 키로 사용합니다.
+# - 메모리 LRU: 최근에 쓴 항목만 `max_items`개 유지
+# - SQLite 파일(선택): 프로그램을 다시 실행해도 이미 받은 응답을 재사용
+# - `ttl`: 오래된 응답은 만료
+# - `stats()`: 히트/미스/저장 바이트 수
+
+# %%
+import hashlib
+import sqlite3
+from collections import OrderedDict
+
+class ResponseCache:
+    """메모리 LRU + SQLite 2단계 응답 캐시"""
+    
+    def __init__(
+        self,
+        max_items: int = 1000,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+        max_disk_bytes: int = 100 * 1024 * 1024
+    ):
+        """
+        Args:
+            max_items: 메모리에 보관할 최대 항목 수
+            ttl: 유효 기간 (초, None이면 만료 없음)
+            path: SQLite 파일 경로 (None이면 메모리만 사용)
+            max_disk_bytes: 디스크 캐시 최대 크기
+        """
+        self.max_items = max_items
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()  # key -> (저장 시각, 값)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT, created REAL, accessed REAL, size INTEGER)"
+            )
+            self._db.commit()
+    
+    @staticmethod
+    def make_key(model: str, payload: dict) -> str:
+        """요청 내용으로 안정적인 키 생성 (실행마다 같은 값)"""
+        raw = json.dumps({"model": model, "payload": payload}, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+    
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and not self._expired(entry[0]):
+                self._memory.move_to_end(key)  # 최근 사용으로 표시
+                self.hits += 1
+                return entry[1]
+            self._memory.pop(key, None)
+            
+            if self._db:
+                row = self._db.execute(
+                    "SELECT value, created FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row and not self._expired(row[1]):
+                    self._db.execute("UPDATE cache SET accessed = ? WHERE key = ?", (time.time(), key))
+                    self._db.commit()
+                    self._remember(key, row[1], row[0])
+                    self.hits += 1
+                    return row[0]
+                if row:  # 만료된 항목은 디스크에서도 삭제
+                    self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._db.commit()
+            
+            self.misses += 1
+            return None
+    
+    def set(self, key: str, value: str):
+        """캐시 저장"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                    (key, value, now, now, len(value.encode("utf-8")))
+                )
+                self._evict_disk()
+                self._db.commit()
+    
+    def _remember(self, key: str, created: float, value: str):
+        """메모리 LRU에 저장하고 초과분 제거 (lock 안에서 호출)"""
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)  # 가장 오래 안 쓴 항목
+    
+    def _evict_disk(self):
+        """만료 항목과 용량 초과분 삭제 (lock 안에서 호출)"""
+        if self.ttl is not None:
+            self._db.execute("DELETE FROM cache WHERE created < ?", (time.time() - self.ttl,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total > self.max_disk_bytes:
+            rows = self._db.execute("SELECT key, size FROM cache ORDER BY accessed").fetchall()
+            for key, size in rows:
+                if total <= self.max_disk_bytes:
+                    break
+                self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                total -= size
+    
+    def clear(self):
+        """메모리와 디스크 캐시 모두 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if self._db:
+                self._db.execute("DELETE FROM cache")
+                self._db.commit()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            if self._db:
+                return self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            return len(self._memory)
+    
+    def stats(self) -> dict:
+        """히트/미스/저장 용량 통계"""
+        with self._lock:
+            memory_bytes = sum(len(v.encode("utf-8")) for _, v in self._memory.values())
+            disk_bytes = 0
+            if self._db:
+                disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_items": len(self._memory),
+            "memory_bytes": memory_bytes,
+            "disk_bytes": disk_bytes,
+        }
+
+# %% [markdown]
+# ### 중복 요청 합치기: SingleFlight
+#
+# 캐시가 비어 있을 때 여러 스레드가 같은 프롬프트를 동시에 요청하면 모두 캐시 미스가 되어 API를 각각 호출합니다.
+# `SingleFlight`는 같은 키로 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과를 기다려 함께 받습니다.
+# - 결과는 호출한 쪽의 캐시에 저장되므로, **같은 캐시를 쓰는 클라이언트끼리만** 합칩니다.
+# - `AsyncSingleFlight`: asyncio용. 기다리는 쪽은 스레드를 차지하지 않고 Future를 `await`합니다.
+
 # %%
+class _Flight:
+    """진행 중인 호출 하나 (결과를 기다리는 호출자들이 공유)"""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 한 번의 실제 호출로 합치기 (스레드 안전)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self.shared = 0  # 다른 호출의 결과를 받아간 횟수
+    
+    def do(self, key: str, fn):
+        """key로 진행 중인 호출이 있으면 그 결과를, 없으면 fn()을 실행해 반환"""
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+        
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """asyncio용 SingleFlight (하나의 이벤트 루프 안에서 사용)"""
+    
+    def __init__(self):
+        self._flights: dict[str, asyncio.Future] = {}
+        self.shared = 0  # 다른 호출의 결과를 받아간 횟수
+    
+    async def do(self, key: str, fn):
+        """key로 진행 중인 호출이 있으면 그 결과를, 없으면 await fn()의 결과를 반환"""
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.shared += 1
+            return await asyncio.shield(flight)  # 한 호출자가 취소돼도 다른 호출자에게 영향 없음
+        
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # 기다리는 호출자가 없어도 경고가 나지 않도록 확인 처리
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
+
+# %%
+import weakref
+
 class CachedGeminiClient(RobustGeminiClient):
     """
     캐싱이 포함된 클라이언트
     
     다중 상속 체인:
     GeminiClient → RobustGeminiClient → CachedGeminiClient
+    
+    진행 중인 요청(in_flight)은 캐시 객체마다 하나씩 두므로,
+    같은 캐시를 공유하는 인스턴스끼리는 동일한 요청이 하나로 합쳐집니다.
     """
     
-    def __init__(self, **kwargs):
+    # 캐시 객체 → (SingleFlight, AsyncSingleFlight) - 캐시가 사라지면 함께 정리
+    _flights = weakref.WeakKeyDictionary()
+    
+    def __init__(self, cache: Optional[ResponseCache] = None, **kwargs):
         super().__init__(**kwargs)
-        self._cache = {}  # 캐시 저장소
+        self.cache = cache if cache is not None else ResponseCache()  # 캐시 저장소
+        if self.cache not in self._flights:
+            self._flights[self.cache] = (SingleFlight(), AsyncSingleFlight())
+        self.in_flight, self.async_in_flight = self._flights[self.cache]
+    
+    def _cache_key(self, prompt: str, **kwargs) -> str:
+        """요청 내용으로 캐시 키 생성"""
+        system_prompt = kwargs.get("system_prompt")
+        max_tokens = kwargs.get("max_tokens", 1024)
+        return ResponseCache.make_key(
+            self.model, self._build_payload(prompt, system_prompt, max_tokens)
+        )
     
     def generate_text(self, prompt: str, use_cache: bool = True, **kwargs) -> str:
         """캐시를 활용한 텍스트 생성 (메서드 오버라이드)"""
-        cache_key = hash(prompt + str(kwargs))
+        cache_key = self._cache_key(prompt, **kwargs)
         
-        if use_cache and cache_key in self._cache:
-            print("[캐시 히트]")
-            return self._cache[cache_key]
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print("[캐시 히트]")
+                return cached
         
-        # 부모 메서드 호출
-        result = super().generate_text(prompt, **kwargs)
-        self._cache[cache_key] = result
+        def fetch() -> str:
+            # 앞선 호출이 방금 캐시에 저장했을 수 있으므로 한 번 더 확인
+            cached = self.cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                return cached
+            response = self.generate(prompt, **kwargs)
+            result = self.extract_text(response)
+            if "error" not in response:  # 실패한 응답은 저장하지 않음
+                self.cache.set(cache_key, result)
+            return result
         
-        return result
+        return self.in_flight.do(cache_key, fetch)
+    
+    async def agenerate_text(self, prompt: str, use_cache: bool = True, **kwargs) -> str:
+        """
+        asyncio용 텍스트 생성
+        
+        같은 요청은 이벤트 루프 안에서 AsyncSingleFlight로 합치고,
+        실제 API 호출(requests 기반)만 스레드에서 실행합니다.
+        기다리는 호출자는 스레드를 차지하지 않습니다.
+        """
+        cache_key = self._cache_key(prompt, **kwargs)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        async def fetch() -> str:
+            return await asyncio.to_thread(self.generate_text, prompt, use_cache, **kwargs)
+        
+        return await self.async_in_flight.do(cache_key, fetch)
     
     def clear_cache(self):
         """캐시 초기화"""
-        self._cache = {}
+        self.cache.clear()
         print("캐시가 초기화되었습니다.")
     
     @property
     def cache_size(self) -> int:
         """캐시된 항목 수 (프로퍼티)"""
-        return len(self._cache)
+        return len(self.cache)
 
 # %%
 # 캐시 클라이언트 테스트
@@ -651,6 +1405,45 @@ print(f"캐시 크기: {cached_gemini.cache_size}")
 result2 = cached_gemini.generate_text("파이썬이란?")
 print(f"두 번째 요청: {result2[:50]}...")
 
+# %%
+# 파일 캐시: 프로그램을 다시 실행해도 같은 요청은 API를 호출하지 않음
+# (캐시 파일은 저장소가 아닌 임시 폴더에 저장)
+import tempfile
+
+cache_path = os.path.join(tempfile.gettempdir(), "gemini_cache.db")
+disk_cache = ResponseCache(max_items=500, ttl=24 * 3600, path=cache_path)
+persistent_gemini = CachedGeminiClient(cache=disk_cache)
+
+persistent_gemini.generate_text("파이썬이란?")
+persistent_gemini.generate_text("파이썬이란?")
+print(disk_cache.stats())
+
+# %%
+# 같은 프롬프트를 동시에 10번 요청해도 API는 한 번만 호출됨
+# 시뮬레이션 응답은 즉시 끝나서 요청이 겹치지 않으므로, 응답에 0.5초가 걸리도록 지연을 추가
+class SlowCachedGeminiClient(CachedGeminiClient):
+    """API 응답 지연을 흉내 내는 클라이언트 (메서드 오버라이드)"""
+    def generate(self, prompt: str, **kwargs) -> dict:
+        time.sleep(0.5)
+        return super().generate(prompt, **kwargs)
+
+shared_cache = ResponseCache()
+client_a = SlowCachedGeminiClient(cache=shared_cache)
+client_b = SlowCachedGeminiClient(cache=shared_cache)  # 같은 캐시 → 같은 in_flight
+with ThreadPoolExecutor(max_workers=10) as executor:
+    clients = [client_a, client_b] * 5
+    answers = list(executor.map(lambda c: c.generate_text("설문 요약을 작성해주세요."), clients))
+api_calls = client_a._request_count + client_b._request_count
+print(f"스레드 10개: API 호출 {api_calls}회, 공유된 요청 {client_a.in_flight.shared}개, 캐시 크기 {len(shared_cache)}")
+
+# asyncio: 동시에 10번 요청
+async def ask_concurrently(client, prompt: str, n: int = 10) -> list[str]:
+    return await asyncio.gather(*(client.agenerate_text(prompt) for _ in range(n)))
+
+async_gemini = SlowCachedGeminiClient()
+run_async(ask_concurrently(async_gemini, "고객 불만을 분류해주세요."))
+print(f"코루틴 10개: API 호출 {async_gemini._request_count}회, 공유된 요청 {async_gemini.async_in_flight.shared}개")
+
 # %% [markdown]
 # ---
 # ## 6.11 PromptBuilder 클래스
@@ -278,49 +278,425 @@ result = analyze_with_schema(
 print(f"감성: {result.sentiment}")
 print(f"키워드: {result.keywords}")
 
+# %% [markdown]
+# ### 동시 배치 분석
+#
+# API 호출은 대부분의 시간을 네트워크 응답을 기다리며 보냅니다.
+# `ThreadPoolExecutor`로 여러 요청을 동시에 보내면 전체 시간이 크게 줄어듭니다.
+# - `max_workers`: 동시에 진행할 최대 요청 수 (1이면 순차 실행)
+# - 결과는 입력 순서대로 반환
+# - `on_progress`: 항목이 끝날 때마다 호출되는 진행 상황 콜백
+# - `analyze_batch()`: 이전과 같이 모델 리스트를 반환 (실패한 항목이 있으면 모든 항목이 끝난 뒤 그 예외를 발생)
+# - `analyze_batch_detailed()`: 한 항목이 실패해도 배치 전체는 계속 진행 (`BatchItem.error`에 기록)
+
 # %%
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Generic
+
+@dataclass
+class BatchItem(Generic[T]):
+    """배치 분석의 항목별 결과"""
+    index: int
+    text: str
+    result: Optional[T] = None
+    error: Optional[str] = None
+    exception: Optional[Exception] = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        """분석 성공 여부"""
+        return self.error is None
+
+
+def _analyze_item(index: int, text: str, schema: Type[T], instruction: str) -> BatchItem[T]:
+    """텍스트 하나를 분석하고 실패하면 에러를 기록"""
+    try:
+        result = analyze_with_schema(text, schema, instruction)
+        return BatchItem(index=index, text=text, result=result)
+    except Exception as e:
+        return BatchItem(index=index, text=text, error=f"{type(e).__name__}: {e}", exception=e)
+
+
+def print_progress(done: int, total: int, item: BatchItem) -> None:
+    """기본 진행 상황 콜백"""
+    status = "완료" if item.ok else f"실패 - {item.error}"
+    print(f"분석 중... {done}/{total} (#{item.index + 1} {status})")
+
+
+def analyze_batch_detailed(
+    texts: list[str],
+    schema: Type[T],
+    instruction: str = "분석하세요",
+    max_workers: int = 4,
+    on_progress: Optional[Callable[[int, int, BatchItem], None]] = print_progress
+) -> list[BatchItem[T]]:
+    """
+    여러 텍스트를 동시에 배치로 분석 (항목별 성공/실패 기록)
+    
+    Args:
+        texts: 분석할 텍스트 리스트
+        schema: Pydantic 모델 클래스
+        instruction: 지시사항
+        max_workers: 동시에 진행할 최대 요청 수
+        on_progress: 진행 상황 콜백 (완료 개수, 전체 개수, BatchItem)
+    
+    Returns:
+        입력 순서와 같은 BatchItem 리스트
+    """
+    items: list[Optional[BatchItem[T]]] = [None] * len(texts)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            executor.submit(_analyze_item, i, text, schema, instruction)
+            for i, text in enumerate(texts)
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            item = future.result()
+            items[item.index] = item
+            if on_progress:
+                on_progress(done, len(texts), item)
+    return items
+
+
 def analyze_batch(
     texts: list[str],
     schema: Type[T],
-    instruction: str = "분석하세요"
+    instruction: str = "분석하세요",
+    max_workers: int = 4,
+    on_progress: Optional[Callable[[int, int, BatchItem], None]] = print_progress
 ) -> list[T]:
     """
-    여러 텍스트를 배치로 분석
+    여러 텍스트를 동시에 배치로 분석
     
     Args:
         texts: 분석할 텍스트 리스트
         schema: Pydantic 모델 클래스
         instruction: 지시사항
+        max_workers: 동시에 진행할 최대 요청 수
+        on_progress: 진행 상황 콜백 (완료 개수, 전체 개수, BatchItem)
     
     Returns:
-        검증된 모델 인스턴스 리스트
+        검증된 모델 인스턴스 리스트 (입력 순서)
+    
+    Raises:
+        실패한 항목이 있으면 입력 순서상 첫 번째 실패 항목의 예외
     """
-    results = []
-    for i, text in enumerate(texts, 1):
-        print(f"분석 중... {i}/{len(texts)}")
-        result = analyze_with_schema(text, schema, instruction)
-        results.append(result)
-    return results
+    items = analyze_batch_detailed(texts, schema, instruction, max_workers, on_progress)
+    for item in items:
+        if not item.ok:
+            raise item.exception
+    return [item.result for item in items]
 
 # %%
 # 배치 테스트
+import time
+
 sample_texts = [
     "제품 품질이 정말 좋습니다! 재구매 의사 있어요.",
     "배송이 너무 늦었어요. 3주나 걸렸습니다.",
     "가격 대비 괜찮은 것 같습니다. 보통이에요."
 ]
 
+start = time.perf_counter()
 batch_results = analyze_batch(
     texts=sample_texts,
     schema=SentimentResult,
-    instruction="다음 리뷰의 감성을 분석하세요"
+    instruction="다음 리뷰의 감성을 분석하세요",
+    max_workers=3
 )
+print(f"소요 시간: {time.perf_counter() - start:.1f}초")
 
 print("\n=== 배치 분석 결과 ===")
 for text, result in zip(sample_texts, batch_results):
     print(f"\n텍스트: {text[:30]}...")
     print(f"  감성: {result.sentiment} (신뢰도: {result.confidence:.2f})")
 
+# %%
+# 실패한 항목이 있어도 나머지 결과를 받으려면 analyze_batch_detailed 사용
+detailed_results = analyze_batch_detailed(
+    texts=sample_texts + [""],
+    schema=SentimentResult,
+    instruction="다음 리뷰의 감성을 분석하세요",
+    on_progress=None
+)
+for item in detailed_results:
+    print(f"#{item.index + 1}", item.result.sentiment if item.ok else f"실패: {item.error}")
+
+# %% [markdown]
+# #### 로컬 스텁 서버로 처리량 측정
+#
+# 실제 API 대신 응답마다 0.2초를 기다리는 로컬 HTTP 서버를 띄우고,
+# `client`를 같은 모양(`client.models.generate_content`)의 스텁으로 잠시 바꿔 `max_workers`별 처리량을 비교합니다.
+# 동시 요청 수 한도까지는 처리량이 거의 선형으로 늘어납니다.
+
+# %%
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+STUB_LATENCY = 0.2  # 요청 하나의 응답 지연 (초)
+
+class StubModelHandler(BaseHTTPRequestHandler):
+    """항상 같은 SentimentResult JSON을 지연 후 돌려주는 스텁 모델 서버"""
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(STUB_LATENCY)
+        body = json.dumps({"sentiment": "긍정", "confidence": 0.9, "summary": "스텁 응답"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청 로그 생략
+
+
+class StubClient:
+    """genai.Client처럼 models.generate_content()를 제공하는 스텁 클라이언트"""
+    def __init__(self, url: str):
+        self.url = url
+        self.models = self
+
+    def generate_content(self, model, contents, config=None):
+        request = urllib.request.Request(self.url, data=json.dumps({"contents": contents}).encode())
+        with urllib.request.urlopen(request) as response:
+            return SimpleNamespace(text=response.read().decode())
+
+
+class StubServer(ThreadingHTTPServer):
+    request_queue_size = 64  # 동시 접속이 많아도 연결이 거절되지 않도록
+
+
+stub_server = StubServer(("127.0.0.1", 0), StubModelHandler)
+threading.Thread(target=stub_server.serve_forever, daemon=True).start()
+real_client, client = client, StubClient(f"http://127.0.0.1:{stub_server.server_port}")
+
+try:
+    stub_texts = [f"리뷰 {i}" for i in range(32)]
+    for workers in [1, 2, 4, 8, 16]:
+        start = time.perf_counter()
+        analyze_batch(stub_texts, SentimentResult, max_workers=workers, on_progress=None)
+        elapsed = time.perf_counter() - start
+        print(f"max_workers={workers:2d}: {elapsed:.2f}초, {len(stub_texts) / elapsed:5.1f}건/초")
+finally:
+    client = real_client
+    stub_server.shutdown()
+    stub_server.server_close()
+
+# %% [markdown]
+# ### 묶음(packed) 배치 분석
+#
+# `SentimentResult`처럼 결과가 작은 경우, 리뷰 하나마다 요청을 보내면 프롬프트와 왕복 시간이 대부분을 차지합니다.
+# 여러 텍스트에 번호(id)를 붙여 한 번에 보내고, **결과 리스트** 스키마로 받아 번호로 원래 입력에 연결합니다.
+# - `token_budget`: 한 묶음에 넣을 텍스트와 결과의 토큰 예산 (묶음 크기 자동 결정)
+# - 모델이 빠뜨렸거나 검증에 실패한 항목은 `analyze_with_schema`로 하나씩 다시 분석
+# - 묶음용 스키마(`make_pack_schema`)는 스키마마다 한 번만 만들어 재사용 (`functools.lru_cache`)
+
+# %%
+from functools import lru_cache
+from pydantic import ValidationError, create_model
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (한국어는 약 2자당 1토큰)"""
+    return len(text) // 2 + 1
+
+
+def make_packs(
+    texts: list[str],
+    token_budget: int = 4000,
+    tokens_per_result: int = 100,
+    max_pack_size: int = 50
+) -> list[list[int]]:
+    """토큰 예산에 맞게 텍스트 인덱스를 묶음으로 나누기"""
+    packs, current, used = [], [], 0
+    for i, text in enumerate(texts):
+        cost = estimate_tokens(text) + tokens_per_result
+        if current and (used + cost > token_budget or len(current) >= max_pack_size):
+            packs.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        packs.append(current)
+    return packs
+
+
+@lru_cache(maxsize=None)
+def make_pack_schema(schema: Type[T]) -> tuple[Type[BaseModel], Type[BaseModel]]:
+    """schema에 id 필드를 추가한 항목 모델과, 그 리스트를 담는 묶음 모델 생성 (스키마별로 한 번만 생성)"""
+    item_schema = create_model(
+        f"{schema.__name__}Item",
+        __base__=schema,
+        id=(int, Field(description="입력 텍스트의 번호")),
+    )
+    pack_schema = create_model(
+        f"{schema.__name__}Pack",
+        items=(list[item_schema], Field(description="입력 텍스트마다 결과 하나")),
+    )
+    return item_schema, pack_schema
+
+
+def analyze_pack(
+    texts: list[str],
+    ids: list[int],
+    schema: Type[T],
+    instruction: str = "분석하세요"
+) -> dict[int, T]:
+    """
+    여러 텍스트를 한 번의 요청으로 분석
+    
+    Returns:
+        {입력 인덱스: 검증된 결과} - 빠지거나 검증에 실패한 항목은 포함되지 않음
+    """
+    item_schema, pack_schema = make_pack_schema(schema)
+    numbered = "\n".join(f"[{i}] {texts[i]}" for i in ids)
+    response = client.models.generate_content(
+        model="gemini-2.5-flash",
+        contents=f"{instruction}. 각 텍스트마다 결과를 하나씩 만들고 대괄호 안의 번호를 id로 사용하세요:\n{numbered}",
+        config={
+            "response_mime_type": "application/json",
+            "response_schema": pack_schema,
+        },
+    )
+    
+    results = {}
+    for raw in json.loads(response.text).get("items", []):
+        try:
+            item = item_schema.model_validate(raw)  # 항목별로 검증
+        except ValidationError:
+            continue
+        if item.id in ids and item.id not in results:
+            results[item.id] = schema.model_validate(item.model_dump(exclude={"id"}))
+    return results
+
+
+def analyze_batch_packed(
+    texts: list[str],
+    schema: Type[T],
+    instruction: str = "분석하세요",
+    token_budget: int = 4000,
+    max_workers: int = 4,
+    on_progress: Optional[Callable[[int, int, BatchItem], None]] = print_progress
+) -> list[BatchItem[T]]:
+    """
+    텍스트를 묶음으로 나누어 분석 (묶음들은 동시에 요청)
+    
+    Args:
+        texts: 분석할 텍스트 리스트
+        schema: Pydantic 모델 클래스
+        instruction: 지시사항
+        token_budget: 묶음 하나의 토큰 예산
+        max_workers: 동시에 진행할 최대 요청 수
+        on_progress: 진행 상황 콜백 (완료 개수, 전체 개수, BatchItem)
+    
+    Returns:
+        입력 순서와 같은 BatchItem 리스트
+    """
+    def run(ids: list[int]) -> list[BatchItem[T]]:
+        try:
+            results = analyze_pack(texts, ids, schema, instruction)
+        except Exception:
+            results = {}  # 묶음 전체가 실패하면 모두 개별 분석으로 대체
+        return [
+            BatchItem(index=i, text=texts[i], result=results[i]) if i in results
+            else _analyze_item(i, texts[i], schema, instruction)
+            for i in ids
+        ]
+
+    items: list[Optional[BatchItem[T]]] = [None] * len(texts)
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(run, ids) for ids in make_packs(texts, token_budget)]
+        for future in as_completed(futures):
+            for item in future.result():
+                items[item.index] = item
+                done += 1
+                if on_progress:
+                    on_progress(done, len(texts), item)
+    return items
+
+# %%
+# 설문 응답 전체를 묶음으로 분석
+import csv
+
+with open("data/survey_responses.csv", encoding="utf-8") as f:
+    survey_texts = [row["response_text"] for row in csv.DictReader(f)]
+
+print(f"텍스트 {len(survey_texts)}개 → 요청 {len(make_packs(survey_texts))}개")
+
+start = time.perf_counter()
+packed_results = analyze_batch_packed(
+    texts=survey_texts,
+    schema=SentimentResult,
+    instruction="다음 리뷰들의 감성을 각각 분석하세요",
+    on_progress=None
+)
+print(f"소요 시간: {time.perf_counter() - start:.1f}초")
+
+for item in packed_results[:5]:
+    print(f"{item.text[:25]}... → {item.result.sentiment if item.ok else item.error}")
+
+# %% [markdown]
+# #### 스텁 서버로 요청 수 확인
+#
+# 처리량 측정에 쓴 스텁 서버를 묶음 요청도 처리하도록 확장해, API 키 없이 요청 수를 확인합니다.
+# 텍스트 N개를 묶음으로 보내면 요청은 `make_packs`가 만든 묶음 수(약 N / 묶음 크기)만큼만 나갑니다.
+# 스텁은 일부러 한 항목을 빠뜨려, 빠진 항목만 하나씩 다시 요청하는지도 확인합니다.
+
+# %%
+import math
+import re
+
+class PackStubHandler(StubModelHandler):
+    """묶음 요청이면 번호마다 결과를 하나씩 돌려주는 스텁 (번호 DROP_ID는 일부러 빠뜨림)"""
+    DROP_ID = 3
+    requests = 0
+    
+    def do_POST(self):
+        contents = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["contents"]
+        type(self).requests += 1
+        time.sleep(STUB_LATENCY)
+        ids = [int(i) for i in re.findall(r"^\[(\d+)\] ", contents, flags=re.M)]
+        result = {"sentiment": "긍정", "confidence": 0.9, "summary": "스텁 응답"}
+        if ids:
+            body = {"items": [dict(result, id=i) for i in ids if i != self.DROP_ID]}
+        else:
+            body = result
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+stub_server = StubServer(("127.0.0.1", 0), PackStubHandler)
+threading.Thread(target=stub_server.serve_forever, daemon=True).start()
+real_client, client = client, StubClient(f"http://127.0.0.1:{stub_server.server_port}")
+
+try:
+    stub_texts = [f"리뷰 {i}: 배송이 빨랐고 포장도 꼼꼼했어요." for i in range(200)]
+    packs = make_packs(stub_texts)
+    for name, run in [
+        ("하나씩", lambda: analyze_batch_detailed(stub_texts, SentimentResult, on_progress=None)),
+        ("묶음", lambda: analyze_batch_packed(stub_texts, SentimentResult, on_progress=None)),
+    ]:
+        PackStubHandler.requests = 0
+        start = time.perf_counter()
+        items = run()
+        elapsed = time.perf_counter() - start
+        assert all(item.ok for item in items)
+        print(f"{name}: 텍스트 {len(stub_texts)}개 → 요청 {PackStubHandler.requests}개, {elapsed:.2f}초")
+    # 묶음마다 요청 1개 + 빠뜨린 항목(DROP_ID) 재요청 1개
+    assert PackStubHandler.requests == len(packs) + 1 == math.ceil(len(stub_texts) / len(packs[0])) + 1
+    assert make_pack_schema(SentimentResult) is make_pack_schema(SentimentResult)  # 스키마는 한 번만 생성
+finally:
+    client = real_client
+    stub_server.shutdown()
+    stub_server.server_close()
+
 # %% [markdown]
 # ---
 # ## 8.6 FAQ 생성
@@ -2,54 +2,279 @@
 13. 순수 Python 스크립트 예제: 데이터 분석 + Gemini 구조화 출력
 
 이 스크립트는 순수 Python 프로그램의 기본 구조를 보여줍니다:
-- pandas로 CSV 파일 읽기
+- pandas로 CSV 파일 읽기 (큰 파일은 청크 단위로, 반복 실행 시 컬럼형 캐시 사용)
 - 데이터 전처리 함수
-- Gemini API로 구조화된 분석 결과 요청
+- Gemini API로 구조화된 분석 결과 요청 (스트리밍 지원)
 
 사용법:
-    python 13_pure_python_script.py
+    python 13_pure_python_script.py              # 분석 실행
+    python 13_pure_python_script.py --benchmark  # 성능 측정만 실행 (API 키 불필요)
 """
 
+import hashlib
+import json
 import os
 import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from google import genai
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+try:
+    import pyarrow.feather as feather  # 선택 패키지: CSV 컬럼형 캐시에 사용
+except ImportError:
+    feather = None
 
 # ============================================================================
 # 1. 함수 정의: 데이터 전처리
 # ============================================================================
 
-def load_data(filepath: str) -> pd.DataFrame:
-    """CSV 파일을 pandas DataFrame으로 읽어 반환"""
+CACHE_DIR = ".cache"  # CSV 파일 옆에 만드는 캐시 폴더 이름
+
+
+def _cache_paths(filepath: Path) -> tuple:
+    """CSV 파일에 대응하는 (Feather 캐시, 메타데이터) 경로"""
+    cache_dir = filepath.parent / CACHE_DIR
+    return cache_dir / f"{filepath.name}.feather", cache_dir / f"{filepath.name}.meta.json"
+
+
+def _source_fingerprint(filepath: Path, verify_hash: bool) -> dict:
+    """원본 파일의 크기/수정 시각 (verify_hash이면 SHA-256도)"""
+    stat = filepath.stat()
+    fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if verify_hash:
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        fingerprint["sha256"] = digest.hexdigest()
+    return fingerprint
+
+
+def _read_cache(filepath: Path, fingerprint: dict, memory_map: bool) -> Optional[pd.DataFrame]:
+    """원본이 바뀌지 않았으면 캐시에서 읽고, 아니면 None (캐시가 깨져 있어도 None)"""
+    cache_path, meta_path = _cache_paths(filepath)
+    if not (cache_path.exists() and meta_path.exists()):
+        return None
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            if json.load(f) != fingerprint:
+                return None
+        return feather.read_feather(cache_path, memory_map=memory_map)
+    except Exception as e:  # 깨진 JSON, 잘린 Feather 파일 등은 캐시 미스로 처리
+        print(f"캐시 읽기 실패 (다시 생성): {e}")
+        return None
+
+
+def _atomic_write(path: Path, write: Callable[[Path], None]):
+    """임시 파일에 쓴 뒤 os.replace로 교체 (중간에 실패해도 반쯤 쓴 파일이 남지 않음)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _write_cache(filepath: Path, fingerprint: dict, df: pd.DataFrame):
+    """DataFrame을 Feather 캐시로 저장 (실패해도 로딩은 계속)"""
+    cache_path, meta_path = _cache_paths(filepath)
     try:
-        df = pd.read_csv(filepath)
+        cache_path.parent.mkdir(exist_ok=True)
+        # 메타데이터를 먼저 지워 두면, 데이터만 바뀐 채 중단되어도 다음 로드는 캐시 미스
+        meta_path.unlink(missing_ok=True)
+        # 압축하지 않아야 memory_map으로 읽을 때 복사 없이 사용 가능
+        _atomic_write(cache_path, lambda p: feather.write_feather(df, p, compression="uncompressed"))
+        _atomic_write(meta_path, lambda p: p.write_text(json.dumps(fingerprint), encoding="utf-8"))
+    except Exception as e:
+        print(f"캐시 저장 실패 (무시): {e}")
+
+
+def load_data(
+    filepath: str,
+    use_cache: bool = True,
+    memory_map: bool = True,
+    verify_hash: bool = False
+) -> pd.DataFrame:
+    """
+    CSV 파일을 pandas DataFrame으로 읽어 반환
+    
+    use_cache이면 처음 읽을 때 CSV 옆의 .cache 폴더에 Feather(컬럼형 바이너리) 파일을 만들고,
+    다음부터는 CSV를 다시 파싱하지 않고 캐시를 읽습니다 (pyarrow 필요).
+    원본 파일의 크기나 수정 시각이 바뀌면 (verify_hash이면 내용 해시도 비교) 캐시를 다시 만듭니다.
+    """
+    try:
+        path = Path(filepath)
+        if not use_cache or feather is None:
+            df = pd.read_csv(path)
+        else:
+            fingerprint = _source_fingerprint(path, verify_hash)
+            df = _read_cache(path, fingerprint, memory_map)
+            if df is None:
+                df = pd.read_csv(path)
+                _write_cache(path, fingerprint, df)
         print(f"데이터 로드 완료: {len(df)}행, {len(df.columns)}열")
         return df
     except FileNotFoundError:
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
 
 
-def get_data_summary(df: pd.DataFrame) -> str:
-    """DataFrame의 요약 정보를 문자열로 반환"""
-    summary = []
-    summary.append(f"데이터 크기: {len(df)}행 × {len(df.columns)}열")
-    summary.append(f"\n컬럼: {', '.join(df.columns.tolist())}")
-    summary.append(f"\n결측치:")
-    for col in df.columns:
-        missing = df[col].isna().sum()
-        if missing > 0:
-            summary.append(f"  {col}: {missing}개 ({missing/len(df)*100:.1f}%)")
+# 청크 로딩 시 사용할 명시적 dtype (타입 추론 비용과 메모리 절약)
+# Survived는 지정하지 않음: read_csv의 추론(결측치가 있으면 float64, 없으면 int64)을 그대로 따라야
+# 청크별 합계를 합친 생존자 수가 한 번에 읽은 결과와 같은 형식(341.0 / 342)으로 출력됨
+TITANIC_DTYPES = {
+    "PassengerId": "int32",
+    "Pclass": "Int8",
+    "Name": "string",
+    "Sex": "category",
+    "Age": "float32",
+    "SibSp": "Int8",
+    "Parch": "Int8",
+    "Ticket": "string",
+    "Fare": "float32",
+    "Cabin": "string",
+    "Embarked": "category",
+}
+
+
+def load_data_chunked(
+    filepath: str,
+    chunksize: int = 100_000,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    메모리보다 큰 CSV 파일을 chunksize행씩 나누어 읽는 제너레이터
     
-    if 'Survived' in df.columns:
-        summary.append(f"\n생존률:")
-        summary.append(f"  생존: {df['Survived'].sum()}명 ({df['Survived'].mean()*100:.1f}%)")
-        summary.append(f"  사망: {(df['Survived']==0).sum()}명 ({(df['Survived']==0).mean()*100:.1f}%)")
+    Args:
+        filepath: CSV 파일 경로
+        chunksize: 한 번에 읽을 행 수 (메모리 사용량의 상한)
+        usecols: 읽을 컬럼 목록 (None이면 전체)
+        dtype: 컬럼별 dtype (None이면 TITANIC_DTYPES 중 해당 컬럼)
+    """
+    if not Path(filepath).exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
+    if dtype is None:
+        dtype = TITANIC_DTYPES
+    if usecols is not None:
+        dtype = {col: t for col, t in dtype.items() if col in usecols}
     
-    return "\n".join(summary)
+    with pd.read_csv(filepath, chunksize=chunksize, usecols=usecols, dtype=dtype) as reader:
+        yield from reader
+
+
+@dataclass
+class SummaryStats:
+    """get_data_summary의 부분 집계 (청크별로 계산한 뒤 merge로 합산)"""
+    n_rows: int = 0
+    columns: List[str] = field(default_factory=list)
+    missing: Dict[str, int] = field(default_factory=dict)
+    survived_sum: float = 0   # Survived 합계 (생존자 수)
+    survived_count: int = 0   # Survived 결측이 아닌 행 수 (생존률 분모)
+    died: int = 0             # Survived == 0 인 행 수
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SummaryStats":
+        """DataFrame(또는 청크) 하나의 부분 집계 계산"""
+        # 모든 컬럼의 결측치를 한 번의 벡터 연산으로 계산 (컬럼별 반복 없음)
+        missing = df.isna().sum()
+        stats = cls(
+            n_rows=len(df),
+            columns=df.columns.tolist(),
+            missing={col: int(n) for col, n in missing.items()},
+        )
+        if "Survived" in df.columns:
+            survived = df["Survived"]
+            if isinstance(survived.dtype, np.dtype):
+                values = survived.to_numpy()  # 복사 없이 원본 배열 사용
+            else:
+                values = survived.to_numpy(dtype="float64", na_value=np.nan)  # Int8 등 nullable dtype
+            stats.survived_sum = survived.sum()  # dtype 유지 (float 컬럼이면 305.0처럼 출력)
+            stats.survived_count = stats.n_rows - stats.missing["Survived"]
+            # NaN은 0이 아니므로 count_nonzero로 0의 개수를 바로 계산
+            stats.died = stats.n_rows - int(np.count_nonzero(values))
+        return stats
+    
+    @property
+    def survived_rate(self) -> float:
+        """생존률 (Survived 결측 제외)"""
+        return self.survived_sum / self.survived_count if self.survived_count else float("nan")
+    
+    @property
+    def died_rate(self) -> float:
+        """사망률 (전체 행 기준)"""
+        return self.died / self.n_rows if self.n_rows else float("nan")
+    
+    def to_dict(self) -> dict:
+        """JSON 저장용 딕셔너리"""
+        return {
+            "n_rows": self.n_rows,
+            "n_columns": len(self.columns),
+            "columns": self.columns,
+            "missing": {col: n for col, n in self.missing.items() if n > 0},
+            "survived": int(self.survived_sum),
+            "survived_rate": self.survived_rate,
+            "died": self.died,
+            "died_rate": self.died_rate,
+        }
+    
+    def merge(self, other: "SummaryStats") -> "SummaryStats":
+        """다른 청크의 부분 집계를 더한 새 객체 반환"""
+        columns = self.columns or other.columns
+        return SummaryStats(
+            n_rows=self.n_rows + other.n_rows,
+            columns=columns,
+            missing={col: self.missing.get(col, 0) + other.missing.get(col, 0) for col in columns},
+            survived_sum=self.survived_sum + other.survived_sum,
+            survived_count=self.survived_count + other.survived_count,
+            died=self.died + other.died,
+        )
+    
+    def to_text(self) -> str:
+        """요약 정보 문자열 생성"""
+        summary = []
+        summary.append(f"데이터 크기: {self.n_rows}행 × {len(self.columns)}열")
+        summary.append(f"\n컬럼: {', '.join(self.columns)}")
+        summary.append(f"\n결측치:")
+        for col in self.columns:
+            missing = self.missing[col]
+            if missing > 0:
+                summary.append(f"  {col}: {missing}개 ({missing/self.n_rows*100:.1f}%)")
+        
+        if "Survived" in self.columns:
+            summary.append(f"\n생존률:")
+            summary.append(f"  생존: {self.survived_sum}명 ({self.survived_rate*100:.1f}%)")
+            summary.append(f"  사망: {self.died}명 ({self.died_rate*100:.1f}%)")
+        
+        return "\n".join(summary)
+
+
+def summarize_data(data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> SummaryStats:
+    """
+    DataFrame의 요약 통계를 SummaryStats로 반환
+    
+    data에 load_data_chunked()의 청크들을 넘기면 청크별 부분 집계를 합산하므로
+    파일 전체를 메모리에 올리지 않습니다.
+    """
+    if isinstance(data, pd.DataFrame):
+        return SummaryStats.from_frame(data)
+    
+    stats = SummaryStats()
+    for chunk in data:
+        stats = stats.merge(SummaryStats.from_frame(chunk))
+    return stats
+
+
+def get_data_summary(data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> str:
+    """DataFrame의 요약 정보를 문자열로 반환"""
+    return summarize_data(data).to_text()
 
 
 # ============================================================================
@@ -65,15 +290,135 @@ class DataAnalysisResult(BaseModel):
 
 
 # ============================================================================
-# 3. 함수 정의: AI 분석
+# 3. 스트리밍 JSON 파서: 완성된 필드를 바로 꺼내기
 # ============================================================================
 
-def analyze_with_ai(api_key: str, data_summary: str, sample_data: str) -> DataAnalysisResult:
-    """Gemini API를 사용하여 데이터를 분석하는 함수"""
-    # Gemini 클라이언트 생성
-    client = genai.Client(api_key=api_key)
+class FieldEvent(NamedTuple):
+    """
+    파서가 반환하는 이벤트 하나
+    
+    kind: "start"(리스트 필드가 열림), "item"(리스트 항목 완성, index는 항목 번호), "value"(필드 전체 완성)
+    """
+    field: str
+    value: Any
+    index: Optional[int] = None
+    kind: str = "value"
+
+
+class IncrementalJSONParser:
+    """
+    조각으로 도착하는 JSON 객체에서 완성된 필드를 즉시 반환하는 파서
+    
+    - 최상위 필드 값이 완성되면 FieldEvent(필드명, 값)
+    - 리스트 필드는 열릴 때 kind="start" 이벤트를, 항목이 닫힐 때마다
+      FieldEvent(필드명, 항목, 번호, "item")도 반환 (빈 리스트도 시작을 알 수 있음)
+    """
+    
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0  # 다음에 검사할 위치
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key: Optional[str] = None
+        self._key_start: Optional[int] = None
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+        self._item_count = 0
+        self._is_list = False
+    
+    def feed(self, chunk: str) -> List[FieldEvent]:
+        """새 조각을 추가하고 이번에 완성된 필드 목록을 반환"""
+        self.buffer += chunk
+        events = []
+        for i in range(self._pos, len(self.buffer)):
+            event = self._step(i, self.buffer[i])
+            if event:
+                events.extend(event)
+        self._pos = len(self.buffer)
+        return events
+    
+    def _step(self, i: int, ch: str) -> Optional[List[FieldEvent]]:
+        """문자 하나를 처리 (문자열 안/밖, 중첩 깊이 추적)"""
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+            return None
+        if ch.isspace():
+            return None
+        
+        depth = self._depth
+        if depth == 1 and self._key is None:
+            # 최상위 객체의 키 읽기
+            if ch == '"':
+                self._in_string = True
+                self._key_start = i
+            elif ch == ":":
+                self._key = json.loads(self.buffer[self._key_start:i])
+            elif ch == "}":
+                self._depth = 0
+            return None
+        
+        if depth == 1 and self._value_start is None:
+            self._value_start = i
+            self._is_list = ch == "["
+            if self._is_list:
+                self._depth += 1
+                return [FieldEvent(self._key, None, kind="start")]
+        elif depth == 2 and self._is_list and self._item_start is None and ch not in ",]":
+            self._item_start = i
+        
+        if ch == '"':
+            self._in_string = True
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if depth == 2 and self._is_list:
+                return self._finish_item(i) + self._finish_value(i + 1)
+            if depth == 1:
+                return self._finish_value(i)
+        elif ch == ",":
+            if depth == 2 and self._is_list:
+                return self._finish_item(i)
+            if depth == 1:
+                return self._finish_value(i)
+        return None
     
-    prompt = f"""다음은 Titanic 데이터셋의 요약 정보입니다:
+    def _finish_item(self, end: int) -> List[FieldEvent]:
+        """리스트 항목 하나 완성"""
+        if self._item_start is None:
+            return []
+        value = json.loads(self.buffer[self._item_start:end])
+        event = FieldEvent(self._key, value, self._item_count, "item")
+        self._item_start = None
+        self._item_count += 1
+        return [event]
+    
+    def _finish_value(self, end: int) -> List[FieldEvent]:
+        """최상위 필드 값 완성"""
+        if self._value_start is None:
+            return []
+        value = json.loads(self.buffer[self._value_start:end])
+        event = FieldEvent(self._key, value)
+        self._key = None
+        self._value_start = None
+        self._item_count = 0
+        self._is_list = False
+        return [event]
+
+
+# ============================================================================
+# 4. 함수 정의: AI 분석
+# ============================================================================
+
+def build_prompt(data_summary: str, sample_data: str) -> str:
+    """분석 요청 프롬프트 생성"""
+    return f"""다음은 Titanic 데이터셋의 요약 정보입니다:
 
 {data_summary}
 
@@ -86,24 +431,101 @@ def analyze_with_ai(api_key: str, data_summary: str, sample_data: str) -> DataAn
 3. 추가 분석 권장사항
 4. 전체 요약
 """
+
+
+def analyze_with_ai(
+    api_key: str,
+    data_summary: str,
+    sample_data: str,
+    on_field: Optional[Callable[[FieldEvent], None]] = None
+) -> DataAnalysisResult:
+    """
+    Gemini API를 사용하여 데이터를 분석하는 함수
+    
+    on_field를 주면 응답을 스트리밍으로 받으며, 필드(리스트는 항목)가
+    완성될 때마다 on_field(FieldEvent)를 호출합니다.
+    """
+    # Gemini 클라이언트 생성
+    client = genai.Client(api_key=api_key)
+    prompt = build_prompt(data_summary, sample_data)
+    config = {
+        "response_mime_type": "application/json",
+        "response_schema": DataAnalysisResult,
+    }
     
     # Gemini API 호출
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=prompt,
-        config={
-            "response_mime_type": "application/json",
-            "response_schema": DataAnalysisResult,
-        },
-    )
+    if on_field is None:
+        response = client.models.generate_content(
+            model="gemini-2.5-flash",
+            contents=prompt,
+            config=config,
+        )
+        text = response.text
+    else:
+        parser = IncrementalJSONParser()
+        for chunk in client.models.generate_content_stream(
+            model="gemini-2.5-flash",
+            contents=prompt,
+            config=config,
+        ):
+            for event in parser.feed(chunk.text or ""):
+                on_field(event)
+        text = parser.buffer
     
     # 결과 파싱 및 반환
-    result = DataAnalysisResult.model_validate_json(response.text)
+    result = DataAnalysisResult.model_validate_json(text)
     return result
 
 
+class FieldPrinter:
+    """
+    스트리밍 중 완성된 필드를 바로 출력하는 on_field 콜백
+    
+    출력 순서는 모델이 필드를 보내는 순서와 관계없이 항상 FIELD_ORDER를 따릅니다.
+    순서보다 먼저 도착한 필드는 앞 필드가 끝날 때까지 보관했다가 출력합니다.
+    """
+    
+    FIELD_ORDER = ["key_insights", "data_quality", "recommendations", "summary"]
+    LIST_HEADERS = {"key_insights": "주요 인사이트", "recommendations": "추가 분석 권장사항"}
+    VALUE_LABELS = {"data_quality": "데이터 품질", "summary": "전체 요약"}
+    
+    def __init__(self):
+        self._next = 0  # 다음에 출력할 필드의 FIELD_ORDER 위치
+        self._pending: Dict[str, List[FieldEvent]] = {}  # 필드명 → 아직 출력하지 않은 이벤트
+    
+    def __call__(self, event: FieldEvent):
+        if event.field in self.FIELD_ORDER:
+            self._pending.setdefault(event.field, []).append(event)
+            self._flush()
+    
+    def _flush(self):
+        """현재 순서의 필드를 출력하고, 그 필드가 끝났으면 다음 필드로 진행"""
+        while self._next < len(self.FIELD_ORDER):
+            events = self._pending.pop(self.FIELD_ORDER[self._next], [])
+            for event in events:
+                self._print(event)
+            if not any(event.kind == "value" for event in events):
+                break
+            self._next += 1
+    
+    def finish(self):
+        """스트림이 끝난 뒤 남은 필드를 순서대로 모두 출력 (빠진 필드는 건너뜀)"""
+        for name in self.FIELD_ORDER[self._next:]:
+            for event in self._pending.pop(name, []):
+                self._print(event)
+        self._next = len(self.FIELD_ORDER)
+    
+    def _print(self, event: FieldEvent):
+        if event.kind == "start" and event.field in self.LIST_HEADERS:
+            print(f"\n{self.LIST_HEADERS[event.field]}:")
+        elif event.kind == "item":
+            print(f"  {event.index + 1}. {event.value}")
+        elif event.kind == "value" and event.field in self.VALUE_LABELS:
+            print(f"\n{self.VALUE_LABELS[event.field]}: {event.value}")
+
+
 # ============================================================================
-# 4. 메인 함수
+# 5. 메인 함수
 # ============================================================================
 
 def main():
@@ -130,25 +552,14 @@ def main():
         summary = get_data_summary(df)
         sample_data = df.head(5).to_string()  # token 제한을 위해 샘플 데이터 5행만 문자열로 변환
         
-        # 3. AI 분석 수행
+        # 3. AI 분석 수행 (결과는 도착하는 대로 출력)
         print("\n3. Gemini AI로 분석 중...")
-        result = analyze_with_ai(api_key, summary, sample_data)
-        
-        # 4. 결과 출력
         print("\n" + "=" * 50)
         print("분석 결과")
         print("=" * 50)
-        print(f"\n주요 인사이트:")
-        for i, insight in enumerate(result.key_insights, 1):
-            print(f"  {i}. {insight}")
-        
-        print(f"\n데이터 품질: {result.data_quality}")
-        
-        print(f"\n추가 분석 권장사항:")
-        for i, rec in enumerate(result.recommendations, 1):
-            print(f"  {i}. {rec}")
-        
-        print(f"\n전체 요약: {result.summary}")
+        printer = FieldPrinter()
+        analyze_with_ai(api_key, summary, sample_data, on_field=printer)
+        printer.finish()
         print("=" * 50)
         
     except FileNotFoundError as e:
@@ -162,9 +573,114 @@ def main():
 
 
 # ============================================================================
-# 5. 스크립트 실행
+# 6. 성능 측정 (python 13_pure_python_script.py --benchmark)
+# ============================================================================
+
+def _summary_per_column(df: pd.DataFrame) -> str:
+    """비교용: 컬럼마다 따로 결측치를 세고 Survived를 여러 번 훑던 이전 get_data_summary"""
+    summary = []
+    summary.append(f"데이터 크기: {len(df)}행 × {len(df.columns)}열")
+    summary.append(f"\n컬럼: {', '.join(df.columns.tolist())}")
+    summary.append(f"\n결측치:")
+    for col in df.columns:
+        missing = df[col].isna().sum()
+        if missing > 0:
+            summary.append(f"  {col}: {missing}개 ({missing/len(df)*100:.1f}%)")
+    
+    if 'Survived' in df.columns:
+        summary.append(f"\n생존률:")
+        summary.append(f"  생존: {df['Survived'].sum()}명 ({df['Survived'].mean()*100:.1f}%)")
+        summary.append(f"  사망: {(df['Survived']==0).sum()}명 ({(df['Survived']==0).mean()*100:.1f}%)")
+    
+    return "\n".join(summary)
+
+
+def _best_time(fn: Callable[[], Any], repeat: int = 3) -> float:
+    """fn을 repeat번 실행한 가장 빠른 시간 (초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_summary():
+    """get_data_summary: 컬럼별 반복(이전 방식) vs 한 번의 벡터 연산"""
+    rng = np.random.default_rng(0)
+    
+    def make_frame(n_rows: int, n_columns: int) -> pd.DataFrame:
+        data = {"Survived": rng.integers(0, 2, n_rows).astype("float64")}
+        for i in range(n_columns - 1):
+            values = rng.random(n_rows)
+            values[values < 0.1] = np.nan  # 약 10% 결측치
+            data[f"col{i}"] = values
+        return pd.DataFrame(data)
+    
+    print("get_data_summary (3회 중 최소 시간)")
+    for n_rows, n_columns in [(10_000, 1001), (10_000_000, 3)]:
+        df = make_frame(n_rows, n_columns)
+        assert get_data_summary(df) == _summary_per_column(df)  # 결과는 같아야 함
+        before = _best_time(lambda: _summary_per_column(df))
+        after = _best_time(lambda: get_data_summary(df))
+        print(f"  {n_rows:>10,}행 × {n_columns:>4}열: {before * 1000:6.0f}ms → {after * 1000:6.0f}ms")
+
+
+def benchmark_load(n_rows: int = 891_000):
+    """load_data: CSV 파싱(첫 로드) vs Feather 캐시(다음 로드)"""
+    if feather is None:
+        print("load_data 캐시: pyarrow가 없어 건너뜀")
+        return
+    
+    titanic = pd.read_csv("data/titanic.csv")
+    big = pd.concat([titanic] * (n_rows // len(titanic)), ignore_index=True)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "titanic_big.csv"
+        big.to_csv(csv_path, index=False)
+        
+        start = time.perf_counter()
+        cold = load_data(csv_path)
+        cold_time = time.perf_counter() - start
+        warm_time = _best_time(lambda: load_data(csv_path))
+        warm = load_data(csv_path)
+        pd.testing.assert_frame_equal(cold, warm)
+        
+        # 메타데이터가 깨져도 예외 없이 CSV를 다시 읽고 캐시를 새로 만듦
+        _cache_paths(csv_path)[1].write_text("{깨진 JSON", encoding="utf-8")
+        pd.testing.assert_frame_equal(load_data(csv_path), cold)
+    
+    print(f"load_data ({len(big):,}행): 첫 로드 {cold_time:.2f}초 → 캐시 {warm_time:.3f}초")
+
+
+def check_chunked_summary(chunksize: int = 100):
+    """load_data_chunked로 나누어 집계한 요약이 한 번에 읽은 요약과 같은지 확인 (Survived 결측 포함)"""
+    titanic = pd.read_csv("data/titanic.csv")
+    with_nan = titanic.copy()
+    with_nan.loc[with_nan.index[::150], "Survived"] = np.nan  # 일부 청크에만 결측치
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, df in [("결측 없음", titanic), ("Survived 결측", with_nan)]:
+            csv_path = Path(tmp_dir) / "titanic.csv"
+            df.to_csv(csv_path, index=False)
+            in_memory = get_data_summary(pd.read_csv(csv_path))
+            chunked = get_data_summary(load_data_chunked(str(csv_path), chunksize=chunksize))
+            assert chunked == in_memory, (name, chunked, in_memory)
+            print(f"청크 요약 = 전체 요약 ({name}): {in_memory.splitlines()[-2].strip()}")
+
+
+def run_benchmarks():
+    """성능 측정 실행 (API 키 불필요)"""
+    check_chunked_summary()
+    benchmark_summary()
+    benchmark_load()
+
+
+# ============================================================================
+# 7. 스크립트 실행
 # ============================================================================
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv[1:]:
+        run_benchmarks()
+    else:
+        main()
 
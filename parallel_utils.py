@@ -0,0 +1,23 @@
+"""
+병렬 처리 도우미: 노트북의 ProcessPoolExecutor 예제(01, 03, 05)가 함께 사용합니다.
+
+사용법:
+    from parallel_utils import pool_context
+    ProcessPoolExecutor(max_workers=4, mp_context=pool_context())
+"""
+
+import multiprocessing
+
+
+def pool_context():
+    """
+    ProcessPoolExecutor에 넘길 프로세스 시작 방식(context)
+
+    - fork를 지원하면 (Linux, macOS) fork를 사용합니다.
+      작업 프로세스가 부모를 복제하므로 노트북 셀에서 정의한 함수도 그대로 실행할 수 있습니다.
+    - fork가 없으면 (Windows) 플랫폼 기본 방식(spawn)을 사용합니다.
+      이때 작업 함수는 .py 파일로 옮겨 import 해야 합니다.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()